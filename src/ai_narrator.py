@@ -4,16 +4,29 @@ Now remembers previous slides for coherent narration!
 """
 
 import os
+import re
+import json
+import asyncio
 import logging
 import time
-from typing import Optional, List, Dict
+import threading
+from collections import deque
+from functools import lru_cache, partial
+from itertools import groupby
+from typing import Optional, List, Dict, Tuple, Iterable
 from dotenv import load_dotenv  # NEW: Import dotenv
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential_jitter,
+    retry_if_exception_type,
+    before_sleep_log,
+)
 
 # NEW: Load .env from the same directory (or src/)
 # This looks for .env in the current folder. Adjust path if it's strictly in 'src/'
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 
-logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
 logger = logging.getLogger(__name__)
 
 HARDCODED_KEY = None
@@ -48,6 +61,137 @@ def get_gemini_api_key() -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "genai.Client":
+    """One shared client (and HTTP connection pool) per API key."""
+    return genai.Client(api_key=api_key)
+
+
+_old_sdk_key = None
+
+
+def _configure_old_sdk(api_key: str) -> None:
+    """Configure the (process-global) OLD SDK only when the key changes."""
+    global _old_sdk_key
+    if api_key != _old_sdk_key:
+        old_genai.configure(api_key=api_key)
+        _old_sdk_key = api_key
+
+
+def _invoke_new(client, model_name: str, prompt: str, temperature: float,
+                json_output: bool = False) -> str:
+    """One NEW SDK request; returns the full response text."""
+    if json_output:
+        config = types.GenerateContentConfig(
+            temperature=temperature,
+            response_mime_type="application/json",
+            response_schema=list[str],
+        )
+    else:
+        config = types.GenerateContentConfig(temperature=temperature)
+    response = client.models.generate_content(model=model_name, contents=prompt, config=config)
+    return response.text
+
+
+def _stream_new(client, model_name: str, prompt: str, temperature: float) -> Iterable:
+    """One streamed NEW SDK request; yields response chunks."""
+    return client.models.generate_content_stream(
+        model=model_name,
+        contents=prompt,
+        config=types.GenerateContentConfig(temperature=temperature),
+    )
+
+
+def _invoke_old(model, prompt: str, temperature: float, json_output: bool = False) -> str:
+    """One OLD SDK request; returns the full response text."""
+    generation_config = {"temperature": temperature}
+    if json_output:
+        generation_config["response_mime_type"] = "application/json"
+    return model.generate_content(prompt, generation_config=generation_config).text
+
+
+def _stream_old(model, prompt: str, temperature: float) -> Iterable:
+    """One streamed OLD SDK request; yields response chunks."""
+    return model.generate_content(prompt, generation_config={"temperature": temperature}, stream=True)
+
+
+# Minimum seconds between progress_callback updates (UI re-renders)
+PROGRESS_INTERVAL = 0.2
+
+# Upper bound on concurrent Gemini requests while narrating a deck
+MAX_CONCURRENT_REQUESTS = 8
+
+# Number of body slides narrated per Gemini request
+BATCH_SIZE = 8
+
+# Set to 1/true/yes in .env to also reuse narrations of near-identical slides
+SEMANTIC_CACHE_ENV = "NARRATION_SEMANTIC_CACHE"
+
+# Gemini request quota (requests per minute) and attempts per request
+GEMINI_RPM = 60
+MAX_ATTEMPTS = 4
+
+
+class TransientAPIError(Exception):
+    """Gemini failure worth retrying (rate limit, server error, empty reply)."""
+
+
+class PermanentAuthError(Exception):
+    """Gemini rejected the API key; retrying will not help."""
+
+
+def _classify(error: Exception) -> Exception:
+    """Map an SDK exception onto the retry policy."""
+    error_msg = str(error)
+    if "403" in error_msg or "PERMISSION_DENIED" in error_msg:
+        return PermanentAuthError(error_msg)
+    return TransientAPIError(error_msg)
+
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter shared by all narrator threads.
+    Only blocks when another call would exceed the quota.
+    """
+
+    def __init__(self, calls: int, period: float):
+        self.calls = calls
+        self.period = period
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a call is allowed, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.calls:
+                    self._timestamps.append(now)
+                    return
+                wait = self.period - (now - self._timestamps[0])
+            time.sleep(wait)
+
+
+_rate_limiter = RateLimiter(GEMINI_RPM, 60)
+
+# Rolling context: how many previous slides, and how much of each narration
+CONTEXT_SLIDES = 2
+CONTEXT_TAIL_CHARS = 150
+
+# Slide text longer than this is clipped before it is sent to Gemini
+MAX_SLIDE_CHARS = 1500
+
+_INLINE_WHITESPACE = re.compile(r"[ \t]+")
+
+# A sentence end: . ! or ? followed by whitespace (incl. newline) or the end
+_SENTENCE_END = re.compile(r"[.!?](?=\s|$)")
+
+# Streamed narrations longer than this are cut off at a sentence boundary
+MAX_NARRATION_CHARS = 3000
+
+
 # Narration style presets
 NARRATION_STYLES = {
     "professional": {
@@ -83,6 +227,95 @@ NARRATION_STYLES = {
 }
 
 
+# Static prompt prefixes (identical for every slide of a role, so Gemini
+# can serve them from its prompt cache). Dynamic slide data goes after.
+_SYSTEM_PREFIX_OPENER = (
+    "You are the presenter starting a presentation, narrating its Title Slide.\n\n"
+    "INSTRUCTIONS:\n"
+    "1. Start with 'Good morning everyone' (or a similar warm welcome).\n"
+    "2. Introduce the topic clearly.\n"
+    "3. Give a brief 1-sentence hook about what we will cover.\n"
+    "Tone: {style_desc}\n\n"
+)
+
+_SYSTEM_PREFIX_BODY = (
+    "You are narrating a slide in the middle of a presentation.\n\n"
+    "STRICT INSTRUCTIONS:\n"
+    "1. Do NOT say 'Good morning', 'Hello', or 'Welcome' again.\n"
+    "2. Do NOT introduce yourself.\n"
+    "3. Use a transition phrase (e.g., 'Moving on...', 'Furthermore...', 'As we can see here...') to connect to the previous context.\n"
+    "4. Explain the current slide content naturally.\n"
+    "Tone: {style_desc}\n\n"
+)
+
+_SYSTEM_PREFIX_CLOSER = (
+    "You are concluding a presentation. This is the Final Slide.\n\n"
+    "INSTRUCTIONS:\n"
+    "1. Briefly summarize the main takeaway.\n"
+    "2. Do NOT say 'Good morning' or introduce yourself.\n"
+    "3. End with this exact sign-off: 'Thank you for your attention, and I will see you next week.'\n"
+    "Tone: {style_desc}\n\n"
+)
+
+# Dynamic tails appended to the prefixes (filled with str.format_map)
+_OPENER_TAIL = (
+    "PRESENTATION LENGTH: {total} slides\n"
+    "TITLE SLIDE: '{slide_text}'"
+)
+
+_BODY_TAIL = (
+    "SLIDE POSITION: {slide_number} of {total}\n\n"
+    "PREVIOUS CONTEXT (flow from this):\n{context}\n\n"
+    "CURRENT SLIDE CONTENT:\n{slide_text}"
+)
+
+_CLOSER_TAIL = (
+    "Context from previous slide: {context}\n"
+    "Final Slide Content: {slide_text}"
+)
+
+
+def _trim_to_sentence(text: str) -> str:
+    """
+    Cut text back to its last complete sentence, but only if that keeps
+    more than half of it; otherwise leave the hard cut as is.
+    """
+    end = 0
+    for match in _SENTENCE_END.finditer(text):
+        end = match.end()
+    return text[:end] if end > len(text) // 2 else text
+
+
+def _fallback_text(slide: Dict, text: str, enriched_text: str) -> str:
+    """Text to speak when narration fails: enrichment output, else the full slide text."""
+    if enriched_text != text:
+        return enriched_text
+    return slide.get("text", "").strip()
+
+
+def _context_entry(slide_number: int, narration: str) -> Dict:
+    """History entry: just the narration tail later prompts flow from."""
+    return {'slide_number': slide_number, 'tail': narration[-CONTEXT_TAIL_CHARS:]}
+
+
+def _normalize(text: str) -> str:
+    """
+    Shrink slide text before prompting: collapse runs of spaces, drop
+    repeated consecutive lines and clip very long slides.
+    """
+    lines = (_INLINE_WHITESPACE.sub(" ", line).strip() for line in text.strip().splitlines())
+    text = "\n".join(line for line, _ in groupby(lines))
+
+    if len(text) > MAX_SLIDE_CHARS:
+        text = _trim_to_sentence(text[:MAX_SLIDE_CHARS]).rstrip() + " ..."
+    return text
+
+
+def _escape_braces(text: str) -> str:
+    """Make literal text safe to embed in a str.format template."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
 class AITeacherNarrator:
     """
     Enhanced AI Narrator with context awareness and content enrichment.
@@ -110,36 +343,79 @@ class AITeacherNarrator:
         self.temperature = temperature
         self.style = style
         self.enrichment_level = enrichment_level
-        self.conversation_history = []
+        self.conversation_history: deque = deque(maxlen=CONTEXT_SLIDES)
         self.content_enricher = None
+        self.cache = None
+
+        # Resolve the style and build the prompt templates once per narrator
+        style_config = self._get_style_config(style)
+        style_desc = style_config["prompt_style"]
+        self._style_name = style_config["name"]
+        self._prefix_opener = _SYSTEM_PREFIX_OPENER.format(style_desc=style_desc)
+        self._prefix_body = _SYSTEM_PREFIX_BODY.format(style_desc=style_desc)
+        self._prefix_closer = _SYSTEM_PREFIX_CLOSER.format(style_desc=style_desc)
+        self._opener_tmpl = _escape_braces(self._prefix_opener) + _OPENER_TAIL
+        self._body_tmpl = _escape_braces(self._prefix_body) + _BODY_TAIL
+        self._closer_tmpl = _escape_braces(self._prefix_closer) + _CLOSER_TAIL
+
+        # Narration cache (skips Gemini for slides seen in earlier runs)
+        try:
+            from narration_cache import NarrationCache
+            # Semantic matches can cross slides that differ only in figures,
+            # so that tier stays off unless explicitly enabled
+            semantic = os.environ.get(SEMANTIC_CACHE_ENV, "").strip().lower() in ("1", "true", "yes")
+            self.cache = NarrationCache(semantic=semantic)
+        except Exception as e:
+            logger.warning("⚠ Narration cache not available: %s", e)
+            self.cache = None
 
         # Initialize Content Enricher if level is not "none"
         if enrichment_level and enrichment_level.lower() != "none":
             try:
                 from content_enricher import ContentEnricher
-                self.content_enricher = ContentEnricher(enrichment_level=enrichment_level)
-                logger.info(f"🔬 Content Enricher initialized: {enrichment_level}")
+                # Enrichment requests count against the narrator's quota too
+                self.content_enricher = ContentEnricher(
+                    enrichment_level=enrichment_level,
+                    rate_limiter=_rate_limiter
+                )
+                logger.info("🔬 Content Enricher initialized: %s", enrichment_level)
             except ImportError as e:
-                logger.warning(f"⚠ Content Enricher not available: {e}")
+                logger.warning("⚠ Content Enricher not available: %s", e)
                 self.content_enricher = None
             except Exception as e:
-                logger.warning(f"⚠ Content Enricher initialization failed: {e}")
+                logger.warning("⚠ Content Enricher initialization failed: %s", e)
                 self.content_enricher = None
 
         # Initialize SDK
         try:
+            # Bind the SDK-specific call functions once, not per slide
             if SDK_VERSION == "NEW":
-                self.client = genai.Client(api_key=api_key)
+                self.client = _get_client(api_key)
                 self.model_name = "gemini-2.0-flash-exp"
-                logger.info(f"✓ Using model: {self.model_name}")
+                self._invoke = partial(_invoke_new, self.client, self.model_name)
+                self._stream = partial(_stream_new, self.client, self.model_name)
+                logger.info("✓ Using model: %s", self.model_name)
             else:
-                old_genai.configure(api_key=api_key)
+                _configure_old_sdk(api_key)
                 self.model = old_genai.GenerativeModel("gemini-1.5-flash")
+                self._invoke = partial(_invoke_old, self.model)
+                self._stream = partial(_stream_old, self.model)
                 logger.info("✓ Using model: gemini-1.5-flash")
         except Exception as e:
-            logger.error(f"✗ Failed to initialize Gemini: {e}")
+            logger.error("✗ Failed to initialize Gemini: %s", e)
             raise
 
+    def _cache_scope(self, slide_number: int, total_slides: int) -> str:
+        """Cache scope: settings and slide role that shape the narration."""
+        if slide_number == 1:
+            # The opener prompt announces the deck length
+            role = f"opener:{total_slides}"
+        elif slide_number == total_slides:
+            role = "closer"
+        else:
+            role = "body"
+        return f"{self.style}|{self.temperature}|{self.enrichment_level}|{role}"
+
     def _get_style_config(self, style_key: str) -> dict:
         """Get style configuration, with fallback to engaging."""
         return NARRATION_STYLES.get(style_key, NARRATION_STYLES["engaging"])
@@ -148,21 +424,15 @@ class AITeacherNarrator:
                                      total_slides: int, is_title: bool) -> str:
         """
         Build prompt with strict context roles: Opener, Body, or Closer.
+        The static instruction prefix comes first so Gemini can cache it;
+        only the slide-specific tail changes between calls.
         """
-        style_config = self._get_style_config(self.style)
-        style_desc = style_config["prompt_style"]
-
         # --- 1. THE OPENER (First Slide) ---
         if slide_number == 1:
-            return (
-                f"You are the presenter starting a {total_slides}-slide presentation.\n"
-                f"This is the Title Slide: '{slide_text}'\n\n"
-                "INSTRUCTIONS:\n"
-                "1. Start with 'Good morning everyone' (or a similar warm welcome).\n"
-                "2. Introduce the topic clearly.\n"
-                "3. Give a brief 1-sentence hook about what we will cover.\n"
-                f"Tone: {style_desc}"
-            )
+            return self._opener_tmpl.format_map({
+                "total": total_slides,
+                "slide_text": slide_text,
+            })
 
         # --- 2. THE CLOSER (Last Slide) ---
         elif slide_number == total_slides:
@@ -170,158 +440,376 @@ class AITeacherNarrator:
             context = ""
             if self.conversation_history:
                 last_slide = self.conversation_history[-1]
-                context = f"Previous slide discussed: {last_slide['narration'][:100]}..."
-
-            return (
-                f"You are concluding a presentation. This is the Final Slide.\n"
-                f"Context from previous slide: {context}\n"
-                f"Final Slide Content: {slide_text}\n\n"
-                "INSTRUCTIONS:\n"
-                "1. Briefly summarize the main takeaway.\n"
-                "2. Do NOT say 'Good morning' or introduce yourself.\n"
-                "3. End with this exact sign-off: 'Thank you for your attention, and I will see you next week.'\n"
-                f"Tone: {style_desc}"
-            )
+                context = f"Previous slide ended with: ...{last_slide['tail']}"
+
+            return self._closer_tmpl.format_map({
+                "context": context,
+                "slide_text": slide_text,
+            })
 
         # --- 3. THE BODY (Middle Slides) ---
         else:
             # Build context from previous slides
             context = ""
             if self.conversation_history:
-                # Get last 2 slides for context
-                recent_context = self.conversation_history[-2:]
-                context_items = []
-                for prev_slide in recent_context:
-                    prev_num = prev_slide['slide_number']
-                    # Take the last sentence of the previous narration to ensure flow
-                    prev_narration = prev_slide['narration'][-150:]
-                    context_items.append(f"Slide {prev_num} ended with: ...{prev_narration}")
-                context = "\n".join(context_items)
-
-            return (
-                f"You are narrating slide {slide_number} of {total_slides} (Middle of presentation).\n\n"
-                f"PREVIOUS CONTEXT (flow from this):\n{context}\n\n"
-                f"CURRENT SLIDE CONTENT:\n{slide_text}\n\n"
-                "STRICT INSTRUCTIONS:\n"
-                "1. Do NOT say 'Good morning', 'Hello', or 'Welcome' again.\n"
-                "2. Do NOT introduce yourself.\n"
-                "3. Use a transition phrase (e.g., 'Moving on...', 'Furthermore...', 'As we can see here...') to connect to the previous context.\n"
-                "4. Explain the current slide content naturally.\n"
-                f"Tone: {style_desc}"
+                # History only ever holds the last 2 slides
+                context = "\n".join(
+                    f"Slide {prev['slide_number']} ended with: ...{prev['tail']}"
+                    for prev in self.conversation_history
+                )
+
+            return self._body_tmpl.format_map({
+                "slide_number": slide_number,
+                "total": total_slides,
+                "context": context,
+                "slide_text": slide_text,
+            })
+
+    def _build_batch_prompt(self, batch: List[Tuple[int, str]], total_slides: int) -> str:
+        """
+        Build one prompt narrating several consecutive body slides.
+        The model answers with a JSON array holding one narration per slide.
+        """
+        context = ""
+        if self.conversation_history:
+            last_slide = self.conversation_history[-1]
+            context = f"Slide {last_slide['slide_number']} ended with: ...{last_slide['tail']}"
+
+        slide_list = "\n\n".join(
+            f"--- SLIDE {slide_number} of {total_slides} ---\n{slide_text}"
+            for slide_number, slide_text in batch
+        )
+
+        return (
+            f"{self._prefix_body}"
+            f"OUTPUT FORMAT: Return a JSON array with exactly {len(batch)} strings, "
+            "one narration per slide below, in the same order. "
+            "Each narration should flow from the one before it.\n\n"
+            f"PREVIOUS CONTEXT (flow from this):\n{context}\n\n"
+            f"SLIDES:\n{slide_list}"
+        )
+
+    def _lookup_cached(self, slide: Dict, i: int, total: int, text: str) -> Optional[Dict]:
+        """Reuse a cached narration from a previous run, if any."""
+        if not self.cache:
+            return None
+
+        try:
+            cached = self.cache.get(self._cache_scope(i, total), text)
+        except Exception as e:
+            logger.warning("⚠ Cache lookup failed for slide %s: %s", i, e)
+            return None
+
+        if not cached:
+            return None
+
+        slide["ai_narration"] = cached
+        logger.info("✓ Slide %s/%s narration loaded from cache", i, total)
+        return _context_entry(i, cached)
+
+    def _enrich_text(self, slide: Dict, text: str, i: int, total: int,
+                     progress_callback=None) -> str:
+        """Apply content enrichment (if enabled), falling back to the original text."""
+        if not self.content_enricher or self.enrichment_level == "none":
+            return text
+
+        if progress_callback:
+            progress_callback(f"🔬 Enriching slide {i}/{total}...")
+        try:
+            enriched_text = self.content_enricher.enrich_slide(
+                slide_text=text,
+                slide_number=i,
+                progress_callback=progress_callback
             )
+            slide["enriched_text"] = enriched_text
+            slide["enrichment_level"] = self.enrichment_level
+            logger.info("✓ Slide %s enriched successfully", i)
+            return enriched_text
+        except Exception as e:
+            logger.warning("⚠ Enrichment failed for slide %s: %s", i, e)
+            return text  # Fallback to original
 
-    def narrate_slides(self, slides_data: List[Dict], progress_callback=None) -> List[Dict]:
+    def _stream_narration(self, prompt: str, label: str, progress_callback=None) -> str:
         """
-        Generate context-aware narration for all slides.
-        Each narration considers previous slides for smooth flow.
-        Now with optional content enrichment.
+        Stream a plain-text narration, stopping early if it runs past
+        MAX_NARRATION_CHARS (the model went off the rails).
         """
-        total = len(slides_data)
-        self.conversation_history = []  # Reset for new presentation
+        stream = self._stream(prompt, self.temperature)
+
+        parts = []
+        size = 0
+        for chunk in stream:
+            text = chunk.text or ""
+            parts.append(text)
+            size += len(text)
+            if progress_callback:
+                progress_callback(f"🤖 {label}: {len(parts)} chunks received")
+
+            if size > MAX_NARRATION_CHARS:
+                logger.warning("⚠ %s: Narration exceeded %s chars, truncating", label, MAX_NARRATION_CHARS)
+                close = getattr(stream, "close", None)
+                if close:
+                    close()
+                return _trim_to_sentence("".join(parts)[:MAX_NARRATION_CHARS])
+
+        return "".join(parts)
+
+    @retry(
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=20),
+        retry=retry_if_exception_type(TransientAPIError),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    def _call_gemini(self, prompt: str, label: str, json_output: bool = False,
+                     progress_callback=None) -> str:
+        """
+        Single Gemini request (retried by tenacity on transient errors).
 
-        logger.info(f"🎭 Using narration style: {self._get_style_config(self.style)['name']}")
-        
-        # Log enrichment status
-        if self.content_enricher:
-            logger.info(f"🔬 Content enrichment enabled: {self.enrichment_level}")
-        else:
-            logger.info("📝 Content enrichment: disabled (using standard narration)")
+        Raises:
+            TransientAPIError: Rate limit, server error or empty response
+            PermanentAuthError: The API key was rejected
+        """
+        _rate_limiter.acquire()
+        try:
+            if json_output:
+                narration = self._invoke(prompt, self.temperature, json_output=True)
+            else:
+                narration = self._stream_narration(prompt, label, progress_callback)
+        except Exception as e:
+            raise _classify(e) from e
 
-        for i, slide in enumerate(slides_data, 1):
-            text = slide.get("text", "").strip()
+        if not narration or not narration.strip():
+            raise TransientAPIError(f"{label}: Empty response")
+        return narration.strip()
+
+    def _request_narration(self, prompt: str, label: str, json_output: bool = False,
+                           progress_callback=None) -> Optional[str]:
+        """
+        Send a prompt to Gemini with retries.
+
+        Args:
+            prompt: Full prompt text
+            label: Slide label for logging (e.g. "Slide 3" or "Slides 2-9")
+            json_output: Ask for a JSON array of strings instead of plain text
+            progress_callback: Optional callback, ticked per streamed chunk
+
+        Returns:
+            Stripped response text, or None if every attempt failed
+        """
+        try:
+            return self._call_gemini(prompt, label, json_output, progress_callback)
+        except PermanentAuthError as e:
+            logger.error("✗ API Key Error: %s", e)
+        except TransientAPIError as e:
+            logger.warning("⚠ %s failed after %s attempts: %s", label, MAX_ATTEMPTS, e)
+        return None
+
+    def _finish_slide(self, slide: Dict, i: int, total: int, text: str,
+                      narration: str) -> Dict:
+        """Store a fresh narration on the slide and in the cache."""
+        slide["ai_narration"] = narration
+
+        if self.cache:
+            try:
+                self.cache.put(self._cache_scope(i, total), text, narration)
+            except Exception as e:
+                logger.warning("⚠ Could not cache slide %s: %s", i, e)
+
+        # Returned to the caller, which records it for context
+        return _context_entry(i, narration)
+
+    def _prepare_slides(self, slides_data: List[Dict], total: int,
+                        progress_callback=None) -> Tuple[Dict[int, Tuple], Dict[int, Dict]]:
+        """
+        Sequential pass, in slide order: normalize, reuse cached narrations
+        and enrich the rest. Running this before the parallel narration keeps
+        the enricher's rolling context in slide order.
+
+        Returns:
+            (jobs, cached): jobs maps slide number -> (slide, text, enriched_text)
+            for slides still needing a narration; cached maps slide number ->
+            history entry for slides served from the cache
+        """
+        jobs = {}
+        cached = {}
 
+        for i, slide in enumerate(slides_data, 1):
+            text = _normalize(slide.get("text", ""))
             if len(text) < 5:
                 slide["ai_narration"] = text
                 continue
 
-            # Step 1: Apply content enrichment FIRST (if enabled)
-            enriched_text = text
-            if self.content_enricher and self.enrichment_level != "none":
-                if progress_callback:
-                    progress_callback(f"🔬 Enriching slide {i}/{total}...")
-                try:
-                    enriched_text = self.content_enricher.enrich_slide(
-                        slide_text=text,
-                        slide_number=i,
-                        progress_callback=progress_callback
-                    )
-                    slide["enriched_text"] = enriched_text
-                    slide["enrichment_level"] = self.enrichment_level
-                    logger.info(f"✓ Slide {i} enriched successfully")
-                except Exception as e:
-                    logger.warning(f"⚠ Enrichment failed for slide {i}: {e}")
-                    enriched_text = text  # Fallback to original
-
-            # Step 2: Generate narration (using enriched or original text)
+            # Reuse a cached narration from a previous run
+            entry = self._lookup_cached(slide, i, total, text)
+            if entry:
+                cached[i] = entry
+                continue
+
+            # Apply content enrichment FIRST (if enabled)
+            jobs[i] = (slide, text, self._enrich_text(slide, text, i, total, progress_callback))
+
+        return jobs, cached
+
+    def _narrate_one_by_one(self, pending: List[Tuple[int, Dict, str, str]], total: int,
+                            progress_callback=None) -> List[Dict]:
+        """
+        Narrate already-enriched slides with one request each (blocking).
+        Returns history entries for the narrated slides.
+        """
+        entries = []
+        for i, slide, text, enriched_text in pending:
             if progress_callback:
                 progress_callback(f"🤖 Generating narration {i}/{total} (with context)")
 
             is_title = (i == 1) or (len(text.split()) < 15)
             prompt = self._build_context_aware_prompt(enriched_text, i, total, is_title)
+            narration = self._request_narration(prompt, f"Slide {i}",
+                                                progress_callback=progress_callback)
+            if narration:
+                logger.info("✓ Slide %s/%s narration generated (with context)", i, total)
+                entries.append(self._finish_slide(slide, i, total, text, narration))
+            else:
+                slide["ai_narration"] = _fallback_text(slide, text, enriched_text)
+        return entries
 
-            # Retry mechanism
-            for attempt in (1, 2):
-                try:
-                    if SDK_VERSION == "NEW":
-                        response = self.client.models.generate_content(
-                            model=self.model_name,
-                            contents=prompt,
-                            config=types.GenerateContentConfig(
-                                temperature=self.temperature
-                            ),
-                        )
-                        narration = response.text
-                    else:
-                        response = self.model.generate_content(prompt)
-                        narration = response.text
-
-                    if narration and narration.strip():
-                        narration = narration.strip()
-                        slide["ai_narration"] = narration
-
-                        # Add to conversation history for context
-                        self.conversation_history.append({
-                            'slide_number': i,
-                            'text': text,
-                            'enriched_text': enriched_text if enriched_text != text else None,
-                            'narration': narration
-                        })
-
-                        logger.info(f"✓ Slide {i}/{total} narration generated (with context)")
-                        break
-                    else:
-                        logger.warning(f"⚠ Slide {i} attempt {attempt}: Empty response")
-                        if attempt == 2:
-                            slide["ai_narration"] = enriched_text
-
-                except Exception as e:
-                    error_msg = str(e)
-
-                    if "403" in error_msg or "PERMISSION_DENIED" in error_msg:
-                        logger.error(f"✗ API Key Error: {error_msg}")
-                        slide["ai_narration"] = enriched_text
-                        break
-                    elif "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-                        logger.warning(f"⚠ Rate limit hit on slide {i}, waiting...")
-                        time.sleep(5)
-                        if attempt == 2:
-                            slide["ai_narration"] = enriched_text
-                    else:
-                        logger.warning(f"⚠ Slide {i} attempt {attempt} failed: {e}")
-                        if attempt == 2:
-                            slide["ai_narration"] = enriched_text
-
-                time.sleep(0.8)  # Slightly longer delay for context-aware generation
-
-        logger.info(f"✓ Context-aware narration complete for {total} slides")
-        
-        # Log enrichment summary
+    def _narrate_batch(self, pending: List[Tuple[int, Dict, str, str]], total: int,
+                       progress_callback=None) -> List[Dict]:
+        """
+        Narrate several already-enriched body slides with a single Gemini
+        request (blocking). Falls back to one request per slide if the JSON
+        answer is unusable. Returns history entries for the narrated slides.
+        """
+        if len(pending) == 1:
+            return self._narrate_one_by_one(pending, total, progress_callback)
+
+        first, last = pending[0][0], pending[-1][0]
+        if progress_callback:
+            progress_callback(f"🤖 Generating narration {first}-{last}/{total} (batched)")
+
+        prompt = self._build_batch_prompt([(i, enriched) for i, _, _, enriched in pending], total)
+        raw = self._request_narration(prompt, f"Slides {first}-{last}", json_output=True)
+
+        narrations = None
+        if raw:
+            try:
+                narrations = json.loads(raw)
+            except ValueError as e:
+                logger.warning("⚠ Slides %s-%s: Invalid JSON response (%s)", first, last, e)
+
+        valid = (
+            isinstance(narrations, list)
+            and len(narrations) == len(pending)
+            and all(isinstance(n, str) and n.strip() for n in narrations)
+        )
+
+        if not valid:
+            logger.warning("⚠ Slides %s-%s: Batch failed, narrating one by one", first, last)
+            return self._narrate_one_by_one(pending, total, progress_callback)
+
+        entries = [
+            self._finish_slide(slide, i, total, text, narration.strip())
+            for (i, slide, text, _), narration in zip(pending, narrations)
+        ]
+        logger.info("✓ Slides %s-%s/%s narration generated (batched)", first, last, total)
+        return entries
+
+    def _throttle_progress(self, progress_callback):
+        """
+        Wrap progress_callback so it fires at most once per PROGRESS_INTERVAL
+        seconds across all worker threads, one call at a time; extra updates
+        are dropped. The throttle state lives for one narration run.
+        """
+        if not progress_callback:
+            return None
+
+        lock = threading.Lock()
+        last_sent = 0.0
+
+        def report(message: str) -> None:
+            nonlocal last_sent
+            # The callback runs under the lock too: UI callbacks (e.g. Flet
+            # controls in main.py) must not be updated from two threads at once
+            with lock:
+                now = time.monotonic()
+                if now - last_sent <= PROGRESS_INTERVAL:
+                    return
+                last_sent = now
+                progress_callback(message)
+
+        return report
+
+    async def narrate_slides_async(self, slides_data: List[Dict],
+                                   progress_callback=None) -> List[Dict]:
+        """
+        Generate context-aware narration for all slides concurrently.
+
+        Slides are first enriched sequentially (so enrichment context stays
+        in order). The opener is then narrated, the body slides are sent in
+        batches of BATCH_SIZE fired in parallel (each flowing from the
+        opener), and the closer runs last so it can bridge from the final
+        body slide.
+        """
+        total = len(slides_data)
+        self.conversation_history = deque(maxlen=CONTEXT_SLIDES)  # Reset for new presentation
+
+        logger.info("🎭 Using narration style: %s", self._style_name)
+
+        # Log enrichment status
         if self.content_enricher:
+            logger.info("🔬 Content enrichment enabled: %s", self.enrichment_level)
+        else:
+            logger.info("📝 Content enrichment: disabled (using standard narration)")
+
+        # Workers report through a coalescing wrapper to avoid UI re-render storms
+        report = self._throttle_progress(progress_callback)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Cache lookups and enrichment run first, one slide at a time
+        jobs, cached = await asyncio.to_thread(self._prepare_slides, slides_data, total, report)
+
+        async def narrate(numbers: List[int]) -> List[Dict]:
+            pending = [(i, *jobs[i]) for i in numbers]
+            async with semaphore:
+                return await asyncio.to_thread(self._narrate_batch, pending, total, report)
+
+        body_jobs = [i for i in range(2, total) if i in jobs]
+        passes = [
+            ([1], [narrate([1])] if 1 in jobs else []),
+            (range(2, total), [narrate(body_jobs[k:k + BATCH_SIZE])
+                               for k in range(0, len(body_jobs), BATCH_SIZE)]),
+            ([total] if total > 1 else [], [narrate([total])] if total > 1 and total in jobs else []),
+        ]
+
+        for numbers, coros in passes:
+            results = await asyncio.gather(*coros)
+            entries = [cached[i] for i in numbers if i in cached]
+            for batch_entries in results:
+                entries.extend(batch_entries)
+            # Record history in slide order once the whole pass is done
+            self.conversation_history.extend(sorted(entries, key=lambda e: e['slide_number']))
+
+        logger.info("✓ Context-aware narration complete for %s slides", total)
+
+        # The completion message always goes through, unthrottled
+        if progress_callback:
+            progress_callback(f"✓ Narration complete for {total} slides")
+
+        # Log enrichment summary (skip the count when INFO is off)
+        if self.content_enricher and logger.isEnabledFor(logging.INFO):
             enriched_count = sum(1 for s in slides_data if s.get("enriched_text"))
-            logger.info(f"🔬 Enrichment summary: {enriched_count}/{total} slides enriched")
-        
+            logger.info("🔬 Enrichment summary: %s/%s slides enriched", enriched_count, total)
+
         return slides_data
 
+    def narrate_slides(self, slides_data: List[Dict], progress_callback=None) -> List[Dict]:
+        """
+        Generate context-aware narration for all slides.
+        Each narration considers previous slides for smooth flow.
+        Now with optional content enrichment.
+        """
+        return asyncio.run(self.narrate_slides_async(slides_data, progress_callback))
+
 
 def get_available_styles() -> Dict[str, dict]:
     """
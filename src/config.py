@@ -3,15 +3,33 @@ Configuration management for team project
 Reads API keys from environment variables or secure config file
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Try to load .env file
 try:
-    from dotenv import load_dotenv
+    from dotenv import load_dotenv, dotenv_values
 
     load_dotenv()
 except ImportError:
-    pass
+    dotenv_values = None
+
+
+@lru_cache(maxsize=4)
+def _load_config(path: str) -> dict:
+    """Parse a KEY=value config file once and keep the result."""
+    if dotenv_values is not None:
+        return dotenv_values(path)
+
+    # Minimal fallback when python-dotenv is not installed
+    values = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                var_name, var_value = line.split('=', 1)
+                values[var_name.strip()] = var_value.strip()
+    return values
 
 
 def get_api_key(key_name: str, config_file: str = None) -> str:
@@ -40,13 +58,9 @@ def get_api_key(key_name: str, config_file: str = None) -> str:
     if config_file:
         config_path = Path(config_file)
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                for line in f:
-                    if line.strip() and not line.startswith('#'):
-                        if '=' in line:
-                            var_name, var_value = line.strip().split('=', 1)
-                            if var_name.strip() == key_name:
-                                return var_value.strip()
+            value = _load_config(str(config_path)).get(key_name)
+            if value:
+                return value.strip()
 
     # Not found anywhere
     raise ValueError(
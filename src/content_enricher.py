@@ -18,8 +18,6 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
 logger = logging.getLogger(__name__)
 
 # Import enrichment configuration
@@ -55,12 +53,14 @@ class ContentEnricher:
     supplementary information based on the selected enrichment level.
     """
     
-    def __init__(self, enrichment_level: str = "normal"):
+    def __init__(self, enrichment_level: str = "normal", rate_limiter=None):
         """
         Initialize the ContentEnricher.
         
         Args:
             enrichment_level: Level of enrichment (none, minimal, normal, detailed, academic)
+            rate_limiter: Optional limiter with an acquire() method, called
+                before every Gemini request (shares the caller's quota)
         """
         if not SDK_VERSION:
             raise ImportError("Google Gemini SDK not installed. pip install google-genai")
@@ -69,6 +69,7 @@ class ContentEnricher:
         self.level_config = get_enrichment_level_config(self.enrichment_level)
         self.presentation_topic = ""
         self.enrichment_history = []
+        self.rate_limiter = rate_limiter
         
         # Get API key
         api_key = os.environ.get("GOOGLE_API_KEY")
@@ -219,6 +220,8 @@ class ContentEnricher:
         temperature = self.level_config.get("temperature", 0.7)
         
         for attempt in range(1, 3):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
             try:
                 if SDK_VERSION == "NEW":
                     response = self.client.models.generate_content(
@@ -375,6 +378,8 @@ def get_enrichment_preview(slide_text: str, level: str = "normal") -> str:
 # ============================================================================
 
 if __name__ == "__main__":
+    # Logging is left to the application; configure it for this test run
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
     print("=" * 60)
     print("🔬 CONTENT ENRICHER TEST")
     print("=" * 60)
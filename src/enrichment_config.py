@@ -5,8 +5,10 @@ Defines enrichment levels and prompt templates for AI content enrichment.
 Author: [Your Name]
 """
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Tuple
 from enum import Enum
+from functools import lru_cache
 
 
 class EnrichmentLevel(Enum):
@@ -211,10 +213,27 @@ Output the academically enriched narration text only.
 }
 
 
+# Templates pre-split at their placeholders: (literals, keys) where the
+# prompt is literals[0] + value(keys[0]) + literals[1] + ... + literals[-1]
+_PLACEHOLDER_PATTERN = re.compile(r"\{(slide_text|previous_context|presentation_topic)\}")
+
+
+def _compile_prompt(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a prompt template into literal chunks and placeholder names."""
+    parts = _PLACEHOLDER_PATTERN.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+_COMPILED_PROMPTS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    level: _compile_prompt(template) for level, template in ENRICHMENT_PROMPTS.items()
+}
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=None)
 def get_enrichment_level_config(level: str) -> Dict[str, Any]:
     """
     Get configuration for a specific enrichment level.
@@ -228,6 +247,7 @@ def get_enrichment_level_config(level: str) -> Dict[str, Any]:
     return ENRICHMENT_LEVELS.get(level.lower(), ENRICHMENT_LEVELS["normal"])
 
 
+@lru_cache(maxsize=None)
 def get_enrichment_prompt(level: str) -> str:
     """
     Get the prompt template for a specific enrichment level.
@@ -265,31 +285,36 @@ def format_prompt(level: str, slide_text: str, previous_context: str = "",
     Returns:
         Formatted prompt ready for AI
     """
-    template = get_enrichment_prompt(level)
-    
-    return template.format(
-        slide_text=slide_text,
-        previous_context=previous_context if previous_context else "This is the first slide.",
-        presentation_topic=presentation_topic if presentation_topic else "General presentation"
-    )
+    literals, keys = _COMPILED_PROMPTS.get(level.lower(), _COMPILED_PROMPTS["normal"])
+    values = {
+        "slide_text": slide_text,
+        "previous_context": previous_context if previous_context else "This is the first slide.",
+        "presentation_topic": presentation_topic if presentation_topic else "General presentation",
+    }
+
+    parts = [literals[0]]
+    for key, literal in zip(keys, literals[1:]):
+        parts.append(values[key])
+        parts.append(literal)
+    return "".join(parts)
 
 
 # ============================================================================
 # UI HELPER - Dropdown Options
 # ============================================================================
 
-def get_dropdown_options() -> list:
+@lru_cache(maxsize=None)
+def get_dropdown_options() -> Tuple[Tuple[str, str], ...]:
     """
     Get enrichment levels formatted for UI dropdown.
     
     Returns:
-        List of tuples (key, display_text) for dropdown
+        Tuple of (key, display_text) pairs for dropdown (shared, so immutable)
     """
-    options = []
-    for key, config in ENRICHMENT_LEVELS.items():
-        display = f"{config['name']} - {config['description']}"
-        options.append((key, display))
-    return options
+    return tuple(
+        (key, f"{config['name']} - {config['description']}")
+        for key, config in ENRICHMENT_LEVELS.items()
+    )
 
 
 # ============================================================================
@@ -4,6 +4,7 @@ import json
 from datetime import datetime
 import threading
 import platform
+import logging
 
 # --- NEW: Import dotenv to load environment variables globally ---
 from dotenv import load_dotenv
@@ -12,6 +13,9 @@ from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 # ---------------------------------------------------------------
 
+# Backend modules only create loggers; the app decides how they are shown
+logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
+
 import flet as ft
 
 if platform.system() != 'Windows':
@@ -0,0 +1,150 @@
+"""
+Narration Cache Module
+Persistent cache for AI narrations so re-processing a deck skips Gemini.
+
+Two tiers:
+- exact: SHA-256 of style, temperature, enrichment level, slide role and text
+- semantic: embedding cosine similarity (opt-in, needs sentence-transformers)
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_AVAILABLE = True
+except ImportError:
+    SEMANTIC_AVAILABLE = False
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "pptx_converter" / "narrations.db"
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.95
+
+
+def make_key(scope: str, text: str) -> bytes:
+    """Exact-match cache key for a slide text within a scope."""
+    return hashlib.sha256(f"{scope}|{text}".encode("utf-8")).digest()
+
+
+class NarrationCache:
+    """
+    SQLite-backed narration cache shared by all narrator instances.
+
+    A "scope" groups entries that are interchangeable (same style,
+    temperature, enrichment level and slide role); semantic lookups
+    never cross scopes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, semantic: bool = False):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite file (defaults to ~/.cache/pptx_converter)
+            semantic: Enable the embedding tier (needs sentence-transformers). Off by
+                default: near-identical slides may differ in facts such as figures
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS narrations ("
+            "key BLOB PRIMARY KEY, scope TEXT, narration TEXT, embedding BLOB)"
+        )
+        self._conn.commit()
+
+        self.semantic = semantic and SEMANTIC_AVAILABLE
+        self._model = None
+        # scope -> (narrations, embedding matrix), loaded lazily from disk
+        self._index: Dict[str, Tuple[List[str], "np.ndarray"]] = {}
+
+    def _embed(self, text: str) -> "np.ndarray":
+        """Normalized float32 embedding of the text."""
+        if self._model is None:
+            logger.info("🧠 Loading embedding model: %s", EMBEDDING_MODEL)
+            self._model = SentenceTransformer(EMBEDDING_MODEL)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def _load_scope(self, scope: str) -> Tuple[List[str], "np.ndarray"]:
+        """Load stored embeddings for a scope into memory (once)."""
+        if scope not in self._index:
+            rows = self._conn.execute(
+                "SELECT narration, embedding FROM narrations "
+                "WHERE scope = ? AND embedding IS NOT NULL", (scope,)
+            ).fetchall()
+            narrations = [row[0] for row in rows]
+            if rows:
+                matrix = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+            else:
+                matrix = np.empty((0, 0), dtype=np.float32)
+            self._index[scope] = (narrations, matrix)
+        return self._index[scope]
+
+    def get(self, scope: str, text: str) -> Optional[str]:
+        """
+        Look up a narration, trying the exact tier then the semantic tier.
+
+        Returns:
+            Cached narration or None on miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT narration FROM narrations WHERE key = ?", (make_key(scope, text),)
+            ).fetchone()
+            if row:
+                return row[0]
+
+            if not self.semantic:
+                return None
+
+            narrations, matrix = self._load_scope(scope)
+            if not narrations:
+                return None
+
+            scores = matrix @ self._embed(text)
+            best = int(np.argmax(scores))
+            if scores[best] >= SEMANTIC_THRESHOLD:
+                return narrations[best]
+            return None
+
+    def put(self, scope: str, text: str, narration: str) -> None:
+        """Store a narration for later runs."""
+        with self._lock:
+            embedding = None
+            if self.semantic:
+                vector = self._embed(text)
+                embedding = vector.tobytes()
+                narrations, matrix = self._load_scope(scope)
+                matrix = np.vstack([matrix, vector]) if narrations else vector[None, :]
+                self._index[scope] = (narrations + [narration], matrix)
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO narrations (key, scope, narration, embedding) "
+                "VALUES (?, ?, ?, ?)",
+                (make_key(scope, text), scope, narration, embedding)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached narration."""
+        with self._lock:
+            self._conn.execute("DELETE FROM narrations")
+            self._conn.commit()
+            self._index.clear()
+
+
+if __name__ == "__main__":
+    cache = NarrationCache()
+    count = cache._conn.execute("SELECT COUNT(*) FROM narrations").fetchone()[0]
+    print(f"Cache file: {cache.db_path}")
+    print(f"Cached narrations: {count}")
+    print(f"Semantic tier: {'available' if SEMANTIC_AVAILABLE else 'not installed'}")
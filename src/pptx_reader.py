@@ -1,5 +1,102 @@
+import os
+import json
+import hashlib
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Dict, NamedTuple, Tuple
+
 from pptx import Presentation
-from typing import List, Dict
+
+# Parsed slide text is cached here, keyed by file path, mtime and size
+CACHE_DIR = Path.home() / ".cache" / "pptx_converter" / "pptx"
+
+# Bump when the cache file layout changes
+CACHE_VERSION = 1
+
+
+class _Slide(NamedTuple):
+    """
+    Parsed text of one slide, as held by the in-memory and on-disk caches.
+    Immutable, so cached decks are shared without copying; it is written
+    to the JSON sidecar as a compact [slide_number, text, text_blocks] row.
+    """
+    slide_number: int
+    text: str
+    text_blocks: Tuple[str, ...]
+
+    def to_dict(self) -> Dict:
+        """Fresh slide dict in the format the rest of the pipeline expects."""
+        return {
+            'slide_number': self.slide_number,
+            'text': self.text,  # For AI processing
+            'original_text': self.text,  # Keep a copy
+            'text_blocks': list(self.text_blocks)
+        }
+
+
+def _extract_slide(numbered_slide: Tuple[int, Any]) -> _Slide:
+    """Build the cached record for one (slide_number, slide) pair."""
+    slide_num, slide = numbered_slide
+
+    # Only text-bearing shapes (textbox, placeholder, etc.), read once each
+    text_blocks = tuple(text for shape in slide.shapes
+                        if shape.has_text_frame
+                        for text in (shape.text_frame.text.strip(),) if text)
+
+    return _Slide(slide_num, '\n'.join(text_blocks), text_blocks)
+
+
+def _parse_slides(file_path: str) -> List[_Slide]:
+    """Parse the PowerPoint file with python-pptx."""
+    prs = Presentation(file_path)
+    return [_extract_slide(item) for item in enumerate(prs.slides, start=1)]
+
+
+@lru_cache(maxsize=16)
+def _load_slides(path: str, mtime: float, size: int) -> Tuple[_Slide, ...]:
+    """
+    Parse a file once per (path, mtime, size), backed by a JSON cache on disk
+    so unchanged decks are not re-parsed on later runs either.
+    """
+    sha = hashlib.blake2b(f"v{CACHE_VERSION}-{mtime}-{size}-{path}".encode("utf-8"),
+                          digest_size=16).hexdigest()
+    cache_file = CACHE_DIR / f"{sha}.json"
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return tuple(_Slide(number, text, tuple(blocks))
+                         for number, text, blocks in json.load(f))
+    except (OSError, ValueError, TypeError):
+        pass
+
+    slides = _parse_slides(path)
+
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique temp name, so concurrent writers of one deck can't clobber it
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=CACHE_DIR,
+                                         suffix='.tmp', delete=False) as f:
+            tmp_name = f.name
+            json.dump(slides, f, ensure_ascii=False)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        # Cache is best-effort; just don't leave the temp file behind
+        if tmp_name:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+
+    return tuple(slides)
+
+
+def _get_slides(file_path: str) -> Tuple[_Slide, ...]:
+    """Cached slides for the file's current version."""
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    return _load_slides(path, stat.st_mtime, stat.st_size)
 
 
 def extract_text_from_pptx(file_path: str) -> List[Dict]:
@@ -18,53 +115,12 @@ def extract_text_from_pptx(file_path: str) -> List[Dict]:
             'text_blocks': List[str] (text paragraph by paragraph)
         }
     """
-    try:
-        prs = Presentation(file_path)
-        slides_data = []
-
-        for slide_num, slide in enumerate(prs.slides, start=1):
-            text_blocks = []
-            all_text = []
-
-            # Check each shape (textbox, placeholder, etc.)
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text_content = shape.text.strip()
-                    text_blocks.append(text_content)
-                    all_text.append(text_content)
-
-            # Combine all text
-            combined_text = '\n'.join(all_text) if all_text else ''
-
-            # If text exists, add to slide data
-            if all_text:
-                slides_data.append({
-                    'slide_number': slide_num,
-                    'text': combined_text,  # For AI processing
-                    'original_text': combined_text,  # Keep a copy
-                    'text_blocks': text_blocks
-                })
-            else:
-                # If no text, add as empty slide
-                slides_data.append({
-                    'slide_number': slide_num,
-                    'text': '',
-                    'original_text': '',
-                    'text_blocks': []
-                })
-
-        return slides_data
-
-    except Exception as e:
-        raise Exception(f"Error occurred while reading PowerPoint file: {str(e)}")
+    # Fresh dicts: callers add narration/translation fields to them
+    return [slide.to_dict() for slide in _get_slides(file_path)]
 
 
 def get_slide_count(file_path: str) -> int:
     """
     Returns the total number of slides in the PowerPoint file.
     """
-    try:
-        prs = Presentation(file_path)
-        return len(prs.slides)
-    except Exception as e:
-        raise Exception(f"Error occurred while reading PowerPoint file: {str(e)}")
\ No newline at end of file
+    return len(_get_slides(file_path))